@@ -1,89 +1,372 @@
+import asyncio
+import functools
 import os
 import shutil
 import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+import aiohttp
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DATASET_DIR = os.path.join(DATA_DIR, "dataset")
 DATA_YEARS = range(2016, 2025)
 DATA_URL_STUB = "https://www.opengeodata.nrw.de/produkte/transport_verkehr/unfallatlas/"
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+EXTRACT_BUFFER_SIZE = 1 << 20
+# Bump this when the processed dataframes change so old caches aren't used
+CACHE_VERSION = 1
+ID_COLUMNS = ["ULAND", "UREGBEZ", "UKREIS", "UGEMEINDE"]
+# The IDs only take a few distinct values, so they are stored as categories
+CATEGORY_COLUMNS = [*ID_COLUMNS, "Community_key"]
+DROPPED_COLUMNS = {"UIDENTSTLAE", "UIDENTSTLA", "FID", "PLST"}
+# Types of the remaining columns, under each of the names they have had over
+# the years
+INT_COLUMNS = [
+    "OID_", "OBJECTID", "OBJECTID_1",
+    "UJAHR", "UMONAT", "USTUNDE", "UWOCHENTAG",
+    "UKATEGORIE", "UART", "UTYP1", "ULICHTVERH", "LICHT",
+    "IstRad", "IstPKW", "IstFuss", "IstKrad", "IstGkfz", "IstSonstige", "IstSonstig",
+    "USTRZUSTAND", "STRZUSTAND", "IstStrasse", "IstStrassenzustand",
+]  # fmt: skip
+FLOAT_COLUMNS = ["LINREFX", "LINREFY", "XGCSWGS84", "YGCSWGS84"]
+# Renames to have consistent column naming across years
+COLUMN_RENAMES = {
+    # Accident with other
+    "IstSonstig": "IstSonstige",
+    # Road Surface Condition
+    "STRZUSTAND": "USTRZUSTAND",
+    "IstStrasse": "USTRZUSTAND",
+    "IstStrassenzustand": "USTRZUSTAND",
+    # Light Condition
+    "LICHT": "ULICHTVERH",
+    # IDs
+    "OBJECTID": "OID_",
+    "OBJECTID_1": "OID_",
+}
+
+# The processed dataframes that have been loaded in this process. This is a
+# dict rather than an lru_cache on load_df so get_dfs can check which years are
+# loaded and add the ones read by its worker processes.
+LOADED_DFS: dict[int, pd.DataFrame] = {}
+
+
+async def fetch_data(
+    session: aiohttp.ClientSession,
+    dataset_title: str,
+    download_path: str,
+    existing_size: int = 0,
+):
+    """Fetches the dataset from the URL, resuming a partial download if there is
+    one already.
+
+    Args:
+        session (aiohttp.ClientSession): The session to download with.
+        dataset_title (str): The title of the dataset to fetch.
+        download_path (str): The path to save the downloaded file.
+        existing_size (int): The size of the partial download already at
+            download_path, or 0 to download the whole file.
+    """
+    url = f"{DATA_URL_STUB}{dataset_title}"
+
+    # If we can't get the size, just ask for the rest of the file and let the
+    # server decide
+    total_size = None
+    try:
+        async with session.head(url, allow_redirects=True) as response:
+            response.raise_for_status()
+            total_size = response.content_length
+    except aiohttp.ClientError:
+        pass
+
+    # If the partial download is already the full size it is corrupt, so start
+    # over
+    if total_size is not None and existing_size >= total_size:
+        existing_size = 0
+
+    headers: dict[str, str] = {}
+    if existing_size > 0:
+        print(f"Resuming {dataset_title}...")
+        headers["Range"] = f"bytes={existing_size}-"
+    else:
+        print(f"Fetching {dataset_title}...")
+
+    async with session.get(url, headers=headers) as response:
+        if existing_size == 0 or response.status != 416:
+            response.raise_for_status()
+            # Servers that don't support ranges send the whole file instead
+            mode = "ab" if response.status == 206 else "wb"
+            with open(download_path, mode) as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+            return
+
+    # The server can't resume past the end of the file, so without the size
+    # from HEAD this is how we find out the partial download is full size and
+    # corrupt. Start over.
+    print(f"{dataset_title} is corrupt, fetching it again...")
+    os.remove(download_path)
+    await fetch_data(session, dataset_title, download_path)
+
+
+async def fetch_all(downloads: list[tuple[str, str, int]]) -> set[str]:
+    """Fetches all the datasets concurrently over a shared session.
+
+    Args:
+        downloads (list[tuple[str, str, int]]): The dataset title, download path
+            and size of any partial download of each dataset to fetch.
+
+    Returns:
+        set[str]: The titles of the datasets that couldn't be fetched.
+    """
+    connector = aiohttp.TCPConnector(limit=len(DATA_YEARS))
+    # The archives are large, so don't cap the total transfer time, but give up
+    # on connections that stall
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        # Don't let one failed download cancel the others
+        results = await asyncio.gather(
+            *(fetch_data(session, *download) for download in downloads),
+            return_exceptions=True,
+        )
+
+    failed: set[str] = set()
+    for (title, _, _), result in zip(downloads, results):
+        if isinstance(result, Exception):
+            print(f"Failed to fetch {title}: {result}")
+            failed.add(title)
+    return failed
+
+
+def run_fetch_all(downloads: list[tuple[str, str, int]]) -> set[str]:
+    """Runs fetch_all to completion, even if called from inside a running event
+    loop such as a Jupyter kernel.
+
+    Args:
+        downloads (list[tuple[str, str, int]]): The downloads to pass to
+            fetch_all.
+
+    Returns:
+        set[str]: The titles of the datasets that couldn't be fetched.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(fetch_all(downloads))
+
+    # asyncio.run can't be nested in a running loop, so give it its own thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, fetch_all(downloads)).result()
+
+
+def is_valid_zip(file_path: str) -> bool:
+    """Checks that the zip file is complete and none of its files are corrupt.
+
+    Args:
+        file_path (str): The path of the zip file to check.
+
+    Returns:
+        bool: Whether the zip file is valid.
+    """
+    try:
+        with zipfile.ZipFile(file_path, "r") as zip_ref:
+            return zip_ref.testzip() is None
+    except (zipfile.BadZipFile, zlib.error, EOFError):
+        return False
+
+
+def extract_csv(file_path: str, year: int):
+    """Extracts the .txt or .csv file from the zip file straight to DATA_DIR,
+    naming it [year].csv. The file is copied under a temporary name and then
+    moved into place, so an interrupted extraction never leaves a partial CSV.
+
+    Args:
+        file_path (str): The path of the zip file to extract from.
+        year (int): The year to use in the new filename.
+    """
+    file_name = os.path.basename(file_path)[:-4]
+    print(f"Extracting {file_name}...")
+
+    csv_path = os.path.join(DATA_DIR, f"{year}.csv")
+    tmp_path = f"{csv_path}.{os.getpid()}.tmp"
+    with zipfile.ZipFile(file_path, "r") as zip_ref:
+        for member in zip_ref.infolist():
+            if member.filename.endswith((".txt", ".csv")):
+                try:
+                    with zip_ref.open(member) as src, open(tmp_path, "wb") as dst:
+                        shutil.copyfileobj(src, dst, length=EXTRACT_BUFFER_SIZE)
+                    os.replace(tmp_path, csv_path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                break
 
 
 def fetch_traffic_data():
     """Fetch the traffic data from 2016-2024 if we don't have them already."""
+    os.makedirs(DATA_DIR, exist_ok=True)
 
-    def fetch_data(dataset_title: str, download_path: str):
-        """Fetches the dataset from the URL if it doesn't already exist.
-
-        Args:
-            dataset_title (str): The title of the dataset to fetch.
-            download_path (str): The path to save the downloaded file.
-        """
-        if not os.path.exists(download_path):
-            url = f"{DATA_URL_STUB}{dataset_title}"
-            print(f"Fetching {dataset_title}...")
-            os.system(f"curl -o {download_path} {url}")
-        else:
-            print(f"Already have {dataset_title}, skipping...")
-
-    def extract_zip(extract_path: str, file_path: str):
-        """Extracts the zip file to the specified path if it hasn't been extracted yet.
-        Args:
-            extract_path (str): The path to extract the zip file to.
-            file_path (str): The path of the zip file to extract.
-        """
-        file_name = os.path.basename(file_path)[:-4]
-        if not os.path.exists(extract_path):
-            os.makedirs(extract_path)
-            print(f"Extracting {file_name}...")
-
-            with zipfile.ZipFile(file_path, "r") as zip_ref:
-                zip_ref.extractall(extract_path)
-        else:
-            print(f"Already extracted {file_name}, skipping...")
-
-    def move_files_to_data_dir(extract_path: str, year: int):
-        """Moves files ending in .txt or .csv from extract_path to DATA_DIR,
-        renaming them to [year].csv.
-
-        Args:
-            extract_path (str): The path to search for files.
-            year (int): The year to use in the new filename.
-        """
-        for subdir, _, files in os.walk(extract_path):
-            for file in files:
-                if file.endswith(".txt") or file.endswith(".csv"):
-                    os.rename(
-                        os.path.join(subdir, file),
-                        os.path.join(DATA_DIR, f"{year}.csv"),
-                    )
-
-    if not os.path.exists(DATA_DIR):
-        os.makedirs(DATA_DIR)
+    # List the data directory once instead of checking each file separately
+    existing_files = {entry.name: entry for entry in os.scandir(DATA_DIR)}
 
+    downloads: list[tuple[str, str, int]] = []
+    extractions: list[tuple[int, str, str]] = []
     for year in DATA_YEARS:
         out_csv_file = f"{year}.csv"
-        temp_dir = os.path.join(DATA_DIR, str(year))
 
-        if os.path.exists(os.path.join(DATA_DIR, out_csv_file)):
+        if out_csv_file in existing_files:
             print(f"Already have {out_csv_file}, skipping...")
             continue
 
-        # Download the zip file
         dataset_title = f"Unfallorte{year}_EPSG25832_CSV.zip"
         downloaded_zip_file_path = os.path.join(DATA_DIR, dataset_title)
-        fetch_data(dataset_title, downloaded_zip_file_path)
+        extractions.append((year, dataset_title, downloaded_zip_file_path))
 
-        # Extract the zip file
-        extract_zip(temp_dir, downloaded_zip_file_path)
+        # A complete zip file can be extracted without going to the network
+        entry = existing_files.get(dataset_title)
+        if entry is not None and is_valid_zip(downloaded_zip_file_path):
+            print(f"Already have {dataset_title}, skipping...")
+            continue
+
+        existing_size = entry.stat().st_size if entry is not None else 0
+        downloads.append((dataset_title, downloaded_zip_file_path, existing_size))
+
+    # Download the zip files for all the missing years at once
+    failed = run_fetch_all(downloads) if downloads else set()
+
+    # Download any corrupt zip files again from scratch
+    corrupt = [
+        (title, path, 0)
+        for title, path, _ in downloads
+        if title not in failed and not is_valid_zip(path)
+    ]
+    if corrupt:
+        for title, path, _ in corrupt:
+            print(f"{title} is corrupt, fetching it again...")
+            os.remove(path)
+        failed |= run_fetch_all(corrupt)
+        failed |= {
+            title
+            for title, path, _ in corrupt
+            if title not in failed and not is_valid_zip(path)
+        }
+
+    for year, dataset_title, downloaded_zip_file_path in extractions:
+        if dataset_title in failed:
+            print(f"Couldn't get {dataset_title}, skipping {year}...")
+            continue
+
+        # Pull the relevant file out of the zip file
+        extract_csv(downloaded_zip_file_path, year)
         os.remove(downloaded_zip_file_path)
 
-        # Move the relevant files to DATA_DIR
-        move_files_to_data_dir(temp_dir, year)
 
-        # Delete the whole temporary extraction directory
-        print(f"Cleaning up temporary files for {year}...")
-        shutil.rmtree(temp_dir)
+def read_accidents_csv(path: str, use_fastparse: bool = True) -> pd.DataFrame:
+    """Reads an accident CSV file with the multithreaded pyarrow CSV reader,
+    skipping the columns we don't use.
+    Args:
+        path (str): The path of the CSV file to read.
+        use_fastparse (bool): Whether to give the pyarrow reader the known
+            column types instead of having it infer them. Falls back to
+            inference if the file doesn't match them.
+    Returns:
+        pd.DataFrame: The raw data from the CSV file.
+    """
+    column_types = {c: pa.string() for c in ID_COLUMNS}
+    if use_fastparse:
+        column_types |= {c: pa.int64() for c in INT_COLUMNS}
+        column_types |= {c: pa.float64() for c in FLOAT_COLUMNS}
+
+    # The pyarrow reader only takes a list of columns to include, so pull the
+    # header first. We also don't go through Pandas' pyarrow engine as it casts
+    # to str after parsing, which strips the leading zeros from the IDs.
+    columns = pd.read_csv(path, sep=";", nrows=0).columns  # type: ignore
+    try:
+        # Read straight out of the memory mapped file so the OS handles paging
+        # it in rather than it being copied into Python buffers
+        with pa.memory_map(path) as source:
+            table = pa_csv.read_csv(
+                source,
+                parse_options=pa_csv.ParseOptions(delimiter=";"),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=column_types,
+                    decimal_point=",",
+                    include_columns=[c for c in columns if c not in DROPPED_COLUMNS],
+                ),
+            )
+    except pa.ArrowInvalid:
+        if not use_fastparse:
+            raise
+        print(f"{os.path.basename(path)} doesn't match the known column types...")
+        return read_accidents_csv(path, use_fastparse=False)
+
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def get_cache_path(year: int) -> str:
+    """Get the path of the Parquet cache for the specified year. The caches are
+    laid out as the year partitions of the dataset in DATASET_DIR.
+    Args:
+        year (int): The year to get the cache path for.
+    Returns:
+        str: The path of the cache file.
+    """
+    return os.path.join(DATASET_DIR, f"year={year}", f"{year}.v{CACHE_VERSION}.parquet")
+
+
+def is_fresh(path: str, source_path: str) -> bool:
+    """Checks whether a file exists and is at least as new as its source.
+    Args:
+        path (str): The path of the file to check.
+        source_path (str): The path of the file it was made from.
+    Returns:
+        bool: Whether the file is up to date.
+    """
+    return os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(
+        source_path
+    )
+
+
+def as_categories(df: pd.DataFrame) -> pd.DataFrame:
+    """Converts the ID columns to categories of Arrow strings. Setting the type
+    of the categories explicitly keeps fresh and cached dataframes the same, as
+    Parquet hands the categories back as plain str.
+    Args:
+        df (pd.DataFrame): The dataframe to convert.
+    Returns:
+        pd.DataFrame: The dataframe with categorical ID columns.
+    """
+    df = df.astype({c: "category" for c in CATEGORY_COLUMNS})
+    string_dtype = pd.ArrowDtype(pa.string())
+    return df.astype(
+        {
+            c: pd.CategoricalDtype(df[c].cat.categories.astype(string_dtype))
+            for c in CATEGORY_COLUMNS
+        }
+    )
+
+
+def write_parquet(df: pd.DataFrame, path: str):
+    """Writes the dataframe to a Parquet file. The file is written under a
+    temporary name and then moved into place, so an interrupted write never
+    leaves a partial file at the path.
+    Args:
+        df (pd.DataFrame): The dataframe to write.
+        path (str): The path to write the file to.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 
 def get_df(year: int) -> pd.DataFrame:
@@ -97,60 +380,64 @@ def get_df(year: int) -> pd.DataFrame:
         f"Year {year} not in available data years {list(DATA_YEARS)}"
     )
 
+    # Hand out a shallow copy so callers can't modify the cached dataframe
+    return load_df(year).copy(deep=False)
+
+
+def load_df(year: int) -> pd.DataFrame:
+    """Loads the dataframe for the specified year, keeping it in memory for
+    later calls.
+    Args:
+        year (int): The year to load the dataframe for.
+    Returns:
+        pd.DataFrame: The dataframe for the specified year.
+    """
+    if year not in LOADED_DFS:
+        LOADED_DFS[year] = read_df(year)
+    return LOADED_DFS[year]
+
+
+def read_df(year: int) -> pd.DataFrame:
+    """Reads and processes the dataframe for the specified year, using the
+    cache on disk if it is up to date.
+    Args:
+        year (int): The year to read the dataframe for.
+    Returns:
+        pd.DataFrame: The dataframe for the specified year.
+    """
     path = os.path.join(DATA_DIR, f"{year}.csv")
-    df = pd.read_csv(  # type: ignore
-        path,
-        sep=";",
-        decimal=",",
-        dtype={
-            "UIDENTSTLAE": str,
-            "UIDENTSTLA": str,
-            "UGEMEINDE": str,
-            "ULAND": str,
-            "UREGBEZ": str,
-            "UKREIS": str,
-        },
-    )
+
+    # Use the cached dataframe if it is at least as new as the CSV
+    cache_path = get_cache_path(year)
+    if is_fresh(cache_path, path):
+        return as_categories(pd.read_parquet(cache_path))
+
+    df = read_accidents_csv(path)
 
     # Create a community key column. This is how we can identify cities
-    df["Community_key"] = df["ULAND"] + df["UREGBEZ"] + df["UKREIS"] + df["UGEMEINDE"]
+    # Join the IDs in a single pass rather than building intermediate strings
+    community_key = pd.Series(
+        pd.arrays.ArrowExtensionArray(
+            pc.binary_join_element_wise(*(pa.array(df[c]) for c in ID_COLUMNS), "")  # type: ignore
+        ),
+        index=df.index,
+    )
 
     states = ["11", "02"]
-    for s in states:
-        df.loc[df["ULAND"] == s, "Community_key"] = f"{s}000000"
-
-    # We drop columns for identifiers that we don't care about for analysis
-    if "UIDENTSTLAE" in df.columns:
-        df.drop("UIDENTSTLAE", axis=1, inplace=True)
-    elif "UIDENTSTLA" in df.columns:
-        df.drop("UIDENTSTLA", axis=1, inplace=True)
-
-    if "FID" in df.columns:
-        df.drop("FID", axis=1, inplace=True)
-
-    if "PLST" in df.columns:
-        df.drop("PLST", axis=1, inplace=True)
-
-    # Rename columns to have consistent naming across years
-    df.rename(
-        columns={
-            # Accident with other
-            "IstSonstig": "IstSonstige",
-            # Road Surface Condition
-            "STRZUSTAND": "USTRZUSTAND",
-            "IstStrasse": "USTRZUSTAND",
-            "IstStrassenzustand": "USTRZUSTAND",
-            # Light Condition
-            "LICHT": "ULICHTVERH",
-            # IDs
-            "OBJECTID": "OID_",
-            "OBJECTID_1": "OID_",
-        },
-        inplace=True,
+    community_key = community_key.mask(df["ULAND"].isin(states), df["ULAND"] + "000000")
+
+    df = (
+        df.rename(columns=COLUMN_RENAMES)
+        .assign(
+            Community_key=community_key,
+            # Create a unique id for the entry based on year and OID_
+            UID=lambda d: f"{year}_" + d["OID_"].astype(str),
+        )
+        # This is done last so the community key is built from plain strings
+        .pipe(as_categories)
     )
 
-    # Create a unique id for the entry based on year and OID_
-    df["UID"] = df["OID_"].apply(lambda x: f"{year}_{x}")  # type: ignore
+    write_parquet(df, cache_path)
 
     return df
 
@@ -166,12 +453,132 @@ def get_dfs(years: list[int]) -> dict[int, pd.DataFrame]:
     assert all(year in DATA_YEARS for year in years), (
         f"Some years not in available data years {list(DATA_YEARS)}"
     )
+    # Drop duplicates so two workers never write the same cache file
+    years = list(dict.fromkeys(years))
+
+    missing_years = [year for year in years if year not in LOADED_DFS]
+    if len(missing_years) > 1:
+        # Each year is parsed in its own process so they can load in parallel
+        max_workers = min(len(missing_years), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            LOADED_DFS.update(zip(missing_years, executor.map(read_df, missing_years)))
+
     return {year: get_df(year) for year in years}
 
 
+def build_dataset(years: list[int] | None = None):
+    """Brings the Parquet dataset in DATASET_DIR up to date for the specified
+    years. Its partitions are the caches of the years, so any that are missing
+    or older than their CSV are rewritten.
+    Args:
+        years (list[int] | None): The years to build, or all of them if None.
+    """
+    for year in DATA_YEARS if years is None else years:
+        if not is_fresh(get_cache_path(year), os.path.join(DATA_DIR, f"{year}.csv")):
+            print(f"Adding {year} to the dataset...")
+            # Refresh the cache without keeping the dataframe in memory
+            read_df(year)
+
+
+def scan(
+    years: list[int] | None = None, community_key: str | None = None
+) -> ds.Scanner:
+    """Scans the accident dataset, first bringing the partitions for the years
+    up to date. The filters are pushed down to the Parquet files, so only
+    matching data is read.
+    Args:
+        years (list[int] | None): The years to scan, or all of them if None.
+        community_key (str | None): The community key to filter on, or all of
+            them if None.
+    Returns:
+        ds.Scanner: A scanner over the matching rows.
+    """
+    years = list(DATA_YEARS) if years is None else years
+    assert all(year in DATA_YEARS for year in years), (
+        f"Some years not in available data years {list(DATA_YEARS)}"
+    )
+    build_dataset(years)
+
+    dataset = ds.dataset(
+        [get_cache_path(year) for year in years],
+        format="parquet",
+        partitioning="hive",
+        partition_base_dir=DATASET_DIR,
+    )
+
+    def decode_ids(schema: pa.Schema) -> list[pa.Field]:
+        # The categories of the IDs differ between years, so read them as plain
+        # strings to let the schemas line up
+        return [
+            f.with_type(f.type.value_type) if pa.types.is_dictionary(f.type) else f
+            for f in schema
+        ]
+
+    # The columns vary a little between years, so combine all the schemas. Years
+    # that fell back to inferred types can have a float column where the others
+    # have ints, so let the types widen. The Pandas metadata of any one year
+    # doesn't fit the others, so it is dropped.
+    schemas = [dataset.schema, *(f.physical_schema for f in dataset.get_fragments())]
+    schema = pa.unify_schemas(
+        [pa.schema(decode_ids(s)) for s in schemas], promote_options="permissive"
+    ).remove_metadata()
+    dataset = ds.dataset(
+        [get_cache_path(year) for year in years],
+        schema=schema,
+        format="parquet",
+        partitioning="hive",
+        partition_base_dir=DATASET_DIR,
+    )
+
+    condition = None
+    if community_key is not None:
+        condition = ds.field("Community_key") == community_key
+
+    return dataset.scanner(filter=condition)
+
+
+def get_city_df(year: int, community_key: str) -> pd.DataFrame:
+    """Get the dataframe for a single city in the specified year. Only the rows
+    for the city are read from the year's cache, rather than loading the whole
+    year and filtering it.
+    Args:
+        year (int): The year to get the dataframe for.
+        community_key (str): The community key of the city.
+    Returns:
+        pd.DataFrame: The dataframe for the city in the specified year.
+    """
+    assert year in DATA_YEARS, (
+        f"Year {year} not in available data years {list(DATA_YEARS)}"
+    )
+
+    # Make sure the cache is up to date, without keeping the whole year around
+    cache_path = get_cache_path(year)
+    if not is_fresh(cache_path, os.path.join(DATA_DIR, f"{year}.csv")):
+        read_df(year)
+
+    # Read the year's cache on its own rather than through scan, so the columns
+    # are that year's rather than the unified ones. It is read the same way as
+    # in get_df, so the dtypes match too.
+    df = pd.read_parquet(cache_path, filters=[("Community_key", "==", community_key)])
+    return as_categories(df)
+
+
 def get_city_info() -> pd.DataFrame:
     """Fetches the city info from disk.
 
+    Returns:
+        pd.DataFrame: The city info as a Pandas dataframe
+    """
+    # Hand out a shallow copy so callers can't modify the cached dataframe
+    return load_city_info().copy(deep=False)
+
+
+# Unlike LOADED_DFS, nothing looks inside or fills in this memo from outside,
+# so an lru_cache is enough
+@functools.lru_cache(maxsize=1)
+def load_city_info() -> pd.DataFrame:
+    """Loads the city info from disk, caching the result in memory.
+
     Returns:
         pd.DataFrame: The city info as a Pandas dataframe
     """
@@ -183,9 +590,12 @@ def get_city_info() -> pd.DataFrame:
             "city": str,
             "area in km²": float,
             "population": int,
+            "regional key": str,
         },
-        converters={"regional key": lambda x: str(x)[:5] + str(x)[9:]},
     )
+    # Trim the regional key down to the format of the community key
+    regional_key = df["regional key"]
+    df["regional key"] = regional_key.str.slice(0, 5) + regional_key.str.slice(9)
     df.rename(columns={"area in km²": "sq km"}, inplace=True)
 
     return df
@@ -207,7 +617,6 @@ def get_regional_key(df: pd.DataFrame, city_name: str) -> str:
 
 if __name__ == "__main__":
     fetch_traffic_data()
-    df = get_df(2024)
     city_info = get_city_info()
     berlin_key = get_regional_key(city_info, "Berlin")
-    print(df[df["Community_key"] == berlin_key].head())
+    print(get_city_df(2024, berlin_key).head())